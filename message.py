@@ -1,4 +1,5 @@
 import random
+from collections import defaultdict
 
 class Message:
     def __init__(self, source, destination,timestamp, ttl, message_id):
@@ -15,6 +16,8 @@ class MessageManager:
     def __init__(self):
         self.messages = []
         self.current_time = 0
+        self.active = {}  # message_id -> Message, currently in flight
+        self.activations = defaultdict(list)  # timestamp -> messages activating then
 
     def generate_random_pairs(self, num_messages, node_ids):
         self.messages = []
@@ -24,22 +27,27 @@ class MessageManager:
             ttl = random.randint(5, 15)
             msg = Message(source, dest, timestamp, ttl, i)
             self.messages.append(msg)
-
+        self.active = {}
+        self.activations = defaultdict(list)
+        for msg in self.messages:
+            # Anything already due activates on the next tick
+            self.activations[max(msg.timestamp, self.current_time + 1)].append(msg)
 
     def advance_time(self):
         self.current_time += 1
-        for msg in self.messages:
-            if not msg.delivered and not msg.expired:
-                if self.current_time >= msg.timestamp:
-                    msg.active = True
+        for msg in self.activations.pop(self.current_time, []):
+            msg.active = True
+            self.active[msg.message_id] = msg
 
     def get_active_messages(self):
-        return [msg for msg in self.messages if msg.active and not msg.delivered and not msg.expired]
+        return list(self.active.values())
 
     def mark_delivered(self, msg):
         msg.delivered = True
         msg.active = False
+        self.active.pop(msg.message_id, None)
 
     def mark_expired(self, msg):
         msg.expired = True
         msg.active = False
+        self.active.pop(msg.message_id, None)
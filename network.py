@@ -3,6 +3,7 @@ import math
 import random
 import networkx as nx
 import numpy as np
+from scipy.spatial.distance import pdist
 
 class Node:
     def __init__(self, node_id, x, y):
@@ -28,11 +29,16 @@ class Network:
         self.space_size = space_size
         self.communication_radius = 0
         self.target_avg_neighbors = 4
+        self._pair_dists = None  # condensed pairwise node distances (pdist order), built after placement
+        self._pdist = None  # the same distances sorted, for the radius search
+        self._diameter_cache = None  # topology is fixed once edges are built
+        self._adjacency = None  # CSR adjacency matrix, built on first use
+        self._csr = None  # (indptr, indices) of the adjacency, built on first use
         self._place_nodes()
         self.analyze_distribution()
 
-    def _distance(self, node1, node2):
-        return math.hypot(node1.x - node2.x, node1.y - node2.y)
+    def _coords(self):
+        return np.array([node.position() for node in self.nodes.values()], dtype=float).reshape(-1, 2)
 
     def _get_radius(self):
         if self.communication_radius:
@@ -51,7 +57,13 @@ class Network:
         max_attempts = self.num_nodes * 800
         placed = 0
         attempts = 0
-        positions = []
+        positions = np.empty((self.num_nodes, 2))
+
+        # Background grid for the distance check: with cells of min_distance/sqrt(2)
+        # only the 5x5 block around a candidate can hold a point closer than
+        # min_distance (which only ever shrinks below its initial value)
+        cell = min_distance / math.sqrt(2)
+        grid = {}  # (cell_x, cell_y) -> [(x, y), ...]
 
         print(f"Placing {self.num_nodes} nodes in {self.space_size}x{self.space_size} space...")
         print(f"Minimum distance: {min_distance:.2f}")
@@ -92,30 +104,27 @@ class Network:
                
             else:
                 # Phase 3: Force-based placement - find largest empty area
-                best_x, best_y = 0, 0
-                max_min_dist = 0
-               
                 # Try multiple random points and pick the one farthest from existing nodes
-                for _ in range(50):
-                    test_x = random.uniform(min_distance, self.space_size - min_distance)
-                    test_y = random.uniform(min_distance, self.space_size - min_distance)
-                   
-                    # Find minimum distance to existing nodes
-                    min_dist_to_existing = float('inf')
-                    for ex_x, ex_y in positions:
-                        dist = math.dist((test_x, test_y), (ex_x, ex_y))
-                        min_dist_to_existing = min(min_dist_to_existing, dist)
-                   
-                    if min_dist_to_existing > max_min_dist:
-                        max_min_dist = min_dist_to_existing
-                        best_x, best_y = test_x, test_y
+                test = np.random.uniform(min_distance, self.space_size - min_distance, size=(50, 2))
                
-                x, y = best_x, best_y
+                if placed:
+                    # Minimum distance from each test point to the existing nodes
+                    min_dist_to_existing = np.linalg.norm(
+                        test[:, None, :] - positions[None, :placed, :], axis=2
+                    ).min(axis=1)
+                    x, y = test[min_dist_to_existing.argmax()].tolist()
+                else:
+                    x, y = test[0].tolist()
 
-            # Check distance constraint
+            # Check distance constraint against nearby grid cells only,
+            # comparing squared distances to skip the sqrt
+            cx, cy = int(x / cell), int(y / cell)
+            min_distance_sq = min_distance * min_distance
             too_close = any(
-                math.dist((x, y), (pos_x, pos_y)) < min_distance
-                for pos_x, pos_y in positions
+                (x - pos_x) ** 2 + (y - pos_y) ** 2 < min_distance_sq
+                for dx in range(-2, 3)
+                for dy in range(-2, 3)
+                for pos_x, pos_y in grid.get((cx + dx, cy + dy), ())
             )
            
             if too_close:
@@ -129,7 +138,8 @@ class Network:
             node = Node(placed, x, y)
             self.nodes[placed] = node
             self.graph.add_node(placed, pos=(x, y))
-            positions.append((x, y))
+            positions[placed] = (x, y)
+            grid.setdefault((cx, cy), []).append((x, y))
             placed += 1
             attempts += 1
 
@@ -143,6 +153,9 @@ class Network:
 
         print(f"Successfully placed {placed} nodes with average separation: {min_distance:.2f}")
        
+        coords = self._coords()
+        self._pair_dists = pdist(coords)
+        self._pdist = np.sort(self._pair_dists)
         self.communication_radius = self._calculate_communication_radius(target_avg=4)
         self._create_edges()
 
@@ -153,21 +166,16 @@ class Network:
        
         positions = [(node.x, node.y) for node in self.nodes.values()]
        
-        # Calculate all pairwise distances
-        distances = []
-        for i in range(len(positions)):
-            for j in range(i + 1, len(positions)):
-                dist = math.dist(positions[i], positions[j])
-                distances.append(dist)
+        # Pairwise distances are computed once during placement
+        distances = self._pdist
        
         # Statistics
-        min_dist = min(distances)
-        max_dist = max(distances)
-        avg_dist = sum(distances) / len(distances)
+        min_dist = distances[0]
+        max_dist = distances[-1]
+        avg_dist = distances.mean()
        
         # Calculate distribution uniformity (coefficient of variation)
-        variance = sum((d - avg_dist) ** 2 for d in distances) / len(distances)
-        std_dev = math.sqrt(variance)
+        std_dev = distances.std()
         cv = std_dev / avg_dist if avg_dist > 0 else 0
        
         # Divide space into grid and count nodes per cell
@@ -211,25 +219,10 @@ class Network:
         if len(self.nodes) < 2:
             return self.space_size / 4
            
-        dists = []
-        node_list = list(self.nodes.values())
-       
-        # For large networks - sample for better performance
-        if len(node_list) > 50:
-            sample_size = 2000
-            for _ in range(sample_size):
-                i, j = random.sample(node_list, 2)
-                dists.append(self._distance(i, j))
-        else:
-            # For small networks - full calculation
-            for i in range(len(node_list)):
-                for j in range(i + 1, len(node_list)):
-                    dists.append(self._distance(node_list[i], node_list[j]))
-       
-        dists.sort()
+        dists = self._pdist
        
         # Binary search for optimal radius
-        min_r, max_r = min(dists), max(dists)
+        min_r, max_r = dists[0], dists[-1]
        
         for _ in range(15):
             mid_r = (min_r + max_r) / 2
@@ -245,23 +238,27 @@ class Network:
         return (min_r + max_r) / 2
 
     def _average_neighbors(self, radius):
-        total = 0
-        for i in self.nodes:
-            neighbors = sum(
-                1 for j in self.nodes
-                if i != j and self._distance(self.nodes[i], self.nodes[j]) <= radius
-            )
-            total += neighbors
-        return total / len(self.nodes) if self.nodes else 0
+        if not self.nodes:
+            return 0
+        # Every pair within radius gives both of its nodes a neighbor
+        pairs = np.searchsorted(self._pdist, radius, side='right')
+        return 2 * pairs / len(self.nodes)
 
     def _create_edges(self):
         self.graph.clear_edges()
-        for i in self.nodes:
-            for j in self.nodes:
-                if i != j:
-                    if self._distance(self.nodes[i], self.nodes[j]) <= self.communication_radius:
-                        self.graph.add_edge(i, j)
-                        self.nodes[i].add_neighbor(j)
+        self._diameter_cache = None
+        self._adjacency = None
+        self._csr = None
+        node_ids = list(self.nodes)
+        # Same distances the radius search used, so a radius equal to a
+        # pairwise distance always keeps that edge
+        rows, cols = np.triu_indices(len(node_ids), k=1)
+        close = self._pair_dists <= self.communication_radius
+        for i, j in zip(rows[close].tolist(), cols[close].tolist()):
+            u, v = node_ids[i], node_ids[j]
+            self.graph.add_edge(u, v)
+            self.nodes[u].add_neighbor(v)
+            self.nodes[v].add_neighbor(u)
 
     def get_graph(self):
         return self.graph
@@ -269,10 +266,25 @@ class Network:
     def get_positions(self):
         return {node_id: node.position() for node_id, node in self.nodes.items()}
 
+    def get_adjacency_matrix(self):
+        # Rows/columns follow node ids, which are 0..N-1 by construction
+        if self._adjacency is None:
+            self._adjacency = nx.to_scipy_sparse_array(
+                self.graph, nodelist=sorted(self.nodes), dtype=np.int32, format='csr'
+            )
+        return self._adjacency
+
+    def to_csr(self):
+        # Plain int32 arrays for compiled kernels: neighbors of u are indices[indptr[u]:indptr[u + 1]]
+        if self._csr is None:
+            adjacency = self.get_adjacency_matrix()
+            self._csr = (adjacency.indptr.astype(np.int32), adjacency.indices.astype(np.int32))
+        return self._csr
+
     def get_radius(self):
         return self._get_radius()
 
     def get_diameter(self):
-        if nx.is_connected(self.graph):
-            return nx.diameter(self.graph)
-        return -1
\ No newline at end of file
+        if self._diameter_cache is None:
+            self._diameter_cache = nx.diameter(self.graph) if nx.is_connected(self.graph) else -1
+        return self._diameter_cache
\ No newline at end of file
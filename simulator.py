@@ -1,145 +1,405 @@
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
 from network import Network
 from message import MessageManager
 import networkx as nx
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def _expand_frontier(indptr, indices, frontier, seen, blocked):
+    """One flooding step for every column of frontier over a CSR adjacency.
+
+    frontier and seen are node x message; columns are independent and run
+    in parallel. Frontier nodes send to their unseen neighbours. Returns
+    the newly reached nodes in the same layout, the (sender, receiver)
+    edges that reached them and per-column offsets into those edges.
+    Collided nodes neither forward nor receive.
+    """
+    n, cols = seen.shape
+    new_seen = np.zeros_like(seen)
+    counts = np.zeros(cols, dtype=np.int64)
+    for i in prange(cols):
+        count = 0
+        for u in range(n):
+            if frontier[u, i] and not blocked[u]:
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    if not seen[v, i] and not blocked[v]:
+                        new_seen[v, i] = True
+                        count += 1
+        counts[i] = count
+
+    offsets = np.zeros(cols + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    edges = np.empty((offsets[cols], 2), dtype=np.int64)
+    for i in prange(cols):
+        pos = offsets[i]
+        for u in range(n):
+            if frontier[u, i] and not blocked[u]:
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    if not seen[v, i] and not blocked[v]:
+                        edges[pos, 0] = u
+                        edges[pos, 1] = v
+                        pos += 1
+    return new_seen, edges, offsets
+
 
 class Simulator:
-    def __init__(self, num_nodes,routing_mode="flooding"):
+    ROUTING_MODES = ("flooding", "bidirectional")
+    BACKENDS = ("matplotlib", "vispy")
+
+    # Node face colors, indexed by the codes computed in visualize()
+    NODE_COLORS = to_rgba_array(["lightblue", "pink", "green", "red"])
+    IDLE, COLLIDED, SOURCE, DESTINATION = range(4)
+
+    def __init__(self, num_nodes,routing_mode="flooding", headless=False, backend="matplotlib"):
         self.network = Network(num_nodes)
+        # Topology and positions are fixed for the whole run: keep the graph,
+        # positions and sparse N x N adjacency once, plus its CSR arrays for
+        # the compiled frontier expansion
+        self.graph = self.network.get_graph()
+        self.pos = self.network.get_positions()
+        self.pos_arr = np.array([self.pos[node_id] for node_id in range(len(self.pos))]).reshape(-1, 2)
+        self.adj = self.network.get_adjacency_matrix()
+        self.indptr, self.indices = self.network.to_csr()
         self.message_manager = MessageManager()
+        if routing_mode not in self.ROUTING_MODES:
+            raise ValueError(f"Unknown routing mode: {routing_mode!r}")
         self.routing_mode = routing_mode
-        self.message_states = {}
-        self.message_edges = {}
-        self.acknowledged = {}  
-        self.fig, self.ax = plt.subplots(figsize=(16, 12))
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend!r}")
+        self.seen = np.zeros((len(self.graph), 0), dtype=bool)  # node_id x message_id
+        # Nodes reached from the destination side; only grows in bidirectional mode
+        self.seen_back = np.zeros((len(self.graph), 0), dtype=bool)
+        # Seen nodes that may still have unseen neighbours, per side; only these transmit
+        self.frontier = np.zeros((len(self.graph), 0), dtype=bool)
+        self.frontier_back = np.zeros((len(self.graph), 0), dtype=bool)
+        self.sources = np.zeros(0, dtype=int)  # message_id -> source node
+        self.destinations = np.zeros(0, dtype=int)  # message_id -> destination node
+        self.timestamps = np.zeros(0, dtype=int)  # message_id -> start time
+        self.ttls = np.zeros(0, dtype=int)  # message_id -> hop limit
+        self.hop_count = np.zeros(0, dtype=int)  # message_id -> hops flooded so far
+        self.message_edges = np.zeros((0, 0, 2), dtype=np.int32)  # [message_id, k] -> (sender, receiver)
+        self.edge_count = np.zeros(0, dtype=int)  # message_id -> used rows of message_edges
+        self.drawn_edge_count = np.zeros(0, dtype=int)  # message_id -> edges on screen, -1 if none drawn yet
+        self.acknowledged = np.zeros(0, dtype=bool)  # message_id -> completion seen by the user
         self.paused = True
         self.waiting_for_final_enter = False  # flag to wait for last ENTER
-        self.blocked_nodes = set()  # nodes that had a collision
-
+        self.blocked = np.zeros(len(self.graph), dtype=bool)  # node_id -> had a collision
+        self.message_artists = {}  # message_id -> LineCollection of its path
+        self._msg_colors = np.zeros((0, 4))  # message_id -> RGBA path color
+        self._desc_prefix = {}  # message_id -> fixed part of its side-panel line
+        self._background = None  # cached static part of the figure for blitting
+        # Headless runs (sweeps, benchmarks) never create a figure
+        self.headless = headless
+        # vispy renders on the GPU for graphs too large for matplotlib; it is optional
+        if backend == "vispy" and not headless:
+            try:
+                import vispy.scene  # noqa: F401
+            except ImportError:
+                print("Warning: vispy is not installed, falling back to matplotlib.")
+                backend = "matplotlib"
+        self.backend = backend
+        if not headless and backend == "vispy":
+            self._setup_vispy()
+        elif not headless:
+            self.fig, self.ax = plt.subplots(figsize=(16, 12))
+            self.fig.subplots_adjust(right=0.75)
+            self._draw_base_graph()
+            self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _draw_base_graph(self):
+        # The base graph never changes: draw it once and only update the artists later
+        graph, pos = self.graph, self.pos
+        nx.draw_networkx_edges(graph, pos, ax=self.ax, alpha=0.3)
+        self.node_artist = nx.draw_networkx_nodes(graph, pos, node_color="lightblue", node_size=600, ax=self.ax)
+        self.label_artists = list(nx.draw_networkx_labels(graph, pos, ax=self.ax).values())
+        # Side panel: one persistent text per message status (a Text has a single color),
+        # only repositioned and refilled each frame
+        self.panel_texts = {
+            status: self.fig.text(0.78, 0.7, "", fontsize=9, va='top', ha='left',
+                                  transform=self.fig.transFigure, color=color, visible=False)
+            for status, color in [("waiting", "black"), ("active", "blue"), ("delivered", "green"), ("expired", "red")]
+        }
+        # Everything that changes between frames is animated, i.e. left out of the background
+        for artist in [self.node_artist, self.ax.title, *self.label_artists, *self.panel_texts.values()]:
+            artist.set_animated(True)
+
+    def _setup_vispy(self):
+        # Same static graph as _draw_base_graph, as GPU visuals in a pan/zoom view
+        from vispy import scene
+        self.canvas = scene.SceneCanvas(title="Time: 0", size=(1600, 1200), bgcolor="white")
+        # Graph in the left three quarters, message panel on the right (as with matplotlib)
+        grid = self.canvas.central_widget.add_grid()
+        self.view = grid.add_view(row=0, col=0, col_span=3, camera="panzoom")
+        grid.add_widget(row=0, col=3)
+        edges = np.array(self.graph.edges, dtype=int).reshape(-1, 2)
+        scene.visuals.Line(pos=self.pos_arr[edges].reshape(-1, 2), connect="segments",
+                           color=(0, 0, 0, 0.3), parent=self.view.scene)
+        self.node_artist = scene.visuals.Markers(parent=self.view.scene)
+        self.node_artist.set_data(self.pos_arr, size=24, face_color=self.NODE_COLORS[self.IDLE])
+        self.label_artists = [scene.visuals.Text([str(node_id) for node_id in range(len(self.pos_arr))],
+                                                 pos=self.pos_arr, font_size=8, parent=self.view.scene)]
+        # Paths (order 0) below nodes below labels; without depth testing the order decides
+        self.node_artist.order = 1
+        self.label_artists[0].order = 2
+        self.node_artist.set_gl_state("translucent", depth_test=False)
+        self.view.camera.set_range()
+        # Side panel in canvas pixels: one text per status, one string per line
+        self.panel_texts = {
+            status: scene.visuals.Text([], pos=np.zeros((0, 2)), color=color, font_size=9, face="DejaVu Sans",
+                                       anchor_x="left", anchor_y="top", parent=self.canvas.scene)
+            for status, color in [("waiting", "black"), ("active", "blue"), ("delivered", "green"), ("expired", "red")]
+        }
+        for txt in self.panel_texts.values():
+            txt.visible = False
+
+    def _dynamic_artists(self):
+        # Drawn in order over the background: paths below nodes, labels on top
+        texts = [txt for txt in self.panel_texts.values() if txt.get_visible()]
+        return [*self.message_artists.values(), self.node_artist, *self.label_artists, self.ax.title, *texts]
+
+    def _on_draw(self, event):
+        # A full redraw (first show, resize) renders only the static artists:
+        # cache that as the new background and paint the dynamic ones over it
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._dynamic_artists():
+            self.fig.draw_artist(artist)
 
     def setup_messages(self, num_messages):
         node_ids = list(self.network.nodes.keys())
         self.message_manager.generate_random_pairs(num_messages, node_ids)
-        for msg in self.message_manager.messages:
-            self.message_states[msg.message_id] = set([msg.source])
-            self.message_edges[msg.message_id] = []
-            self.acknowledged[msg.message_id] = False  # not acknowledged yet
+        messages = self.message_manager.messages
+        self.seen = np.zeros((len(node_ids), len(messages)), dtype=bool)
+        self.seen_back = np.zeros((len(node_ids), len(messages)), dtype=bool)
+        self.frontier = np.zeros((len(node_ids), len(messages)), dtype=bool)
+        self.frontier_back = np.zeros((len(node_ids), len(messages)), dtype=bool)
+        self.sources = np.array([msg.source for msg in messages], dtype=int)
+        self.destinations = np.array([msg.destination for msg in messages], dtype=int)
+        self.timestamps = np.array([msg.timestamp for msg in messages], dtype=int)
+        self.acknowledged = np.zeros(len(messages), dtype=bool)  # not acknowledged yet
+        self.ttls = np.array([msg.ttl for msg in messages], dtype=int)
+        self.hop_count = np.zeros(len(messages), dtype=int)
+        # Start with room for one edge per node and grow when a message needs more
+        self.message_edges = np.empty((len(messages), len(node_ids), 2), dtype=np.int32)
+        self.edge_count = np.zeros(len(messages), dtype=int)
+        self.drawn_edge_count = np.full(len(messages), -1, dtype=int)
+        # Path colors cycle through the palette, so every message gets one
+        self._msg_colors = plt.get_cmap('tab20')(np.arange(len(messages)) % 20)
+        # Only the status at the end of a side-panel line changes between frames
+        self._desc_prefix = {
+            m.message_id: f"#{m.message_id}: {m.source}→{m.destination} | TTL={m.ttl} | T={m.timestamp} | "
+            for m in messages
+        }
+        for msg in messages:
+            self.seen[msg.source, msg.message_id] = True
+            self.seen_back[msg.destination, msg.message_id] = True
+            self.frontier[msg.source, msg.message_id] = True
+            self.frontier_back[msg.destination, msg.message_id] = True
+        if not self.headless:
+            self._create_message_artists()
+
+    def _create_message_artists(self):
+        # One path artist per message, created once and only fed new segments later
+        for artist in self.message_artists.values():
+            if self.backend == "vispy":
+                artist.parent = None
+            else:
+                artist.remove()
+        self.message_artists = {}
+        if self.backend == "vispy":
+            from vispy import scene
+        for msg_id in range(len(self.message_edges)):
+            if self.backend == "vispy":
+                self.message_artists[msg_id] = scene.visuals.Line(
+                    connect="segments", color=self._msg_colors[msg_id], width=2, parent=self.view.scene)
+                continue
+            artist = LineCollection([], colors=self._msg_colors[msg_id], linewidths=2, zorder=1, animated=True)
+            self.ax.add_collection(artist, autolim=False)
+            self.message_artists[msg_id] = artist
+
+    def _grow_message_edges(self, needed):
+        # Double the per-message capacity (at least to `needed`), keeping the edges so far
+        capacity = max(needed, 2 * self.message_edges.shape[1])
+        grown = np.empty((len(self.message_edges), capacity, 2), dtype=np.int32)
+        grown[:, :self.message_edges.shape[1]] = self.message_edges
+        self.message_edges = grown
+
+    def get_message_edges(self, msg_id):
+        return self.message_edges[msg_id, :self.edge_count[msg_id]]
 
     def step(self):
         self.message_manager.advance_time()
-        graph = self.network.get_graph()
-        time = self.message_manager.current_time
-
-        # Prepare to detect collisions
-        message_hits = {}  # node_id -> count of incoming messages
 
-        # First pass to count hits per node
-        for msg in self.message_manager.get_active_messages():
-            if time < msg.timestamp or msg.delivered or msg.expired:
-                continue
-            seen_nodes = self.message_states[msg.message_id]
-            for node in seen_nodes:
-                for neighbor in graph.neighbors(node):
-                    if neighbor not in seen_nodes:
-                        message_hits[neighbor] = message_hits.get(neighbor, 0) + 1
+        # Messages in flight this tick; each is one column of the seen matrices
+        active = self.message_manager.get_active_messages()
+        if not active:
+            self.blocked = np.zeros_like(self.blocked)
+            return
+        cols = np.array([msg.message_id for msg in active])
+        forward = self.seen[:, cols]
+        backward = self.seen_back[:, cols]
+
+        # Flooding always grows from the source; bidirectional search grows
+        # whichever side has the smaller frontier, i.e. fewer nodes to transmit
+        grow_back = np.zeros(len(cols), dtype=bool)
+        if self.routing_mode == "bidirectional":
+            grow_back = (np.count_nonzero(self.frontier_back[:, cols], axis=0)
+                         < np.count_nonzero(self.frontier[:, cols], axis=0))
+        seen = np.where(grow_back, backward, forward)
+        frontier = np.where(grow_back, self.frontier_back[:, cols], self.frontier[:, cols])
+
+        # Count hits per node: frontier neighbours of every not-yet-seen node, per message
+        # (one sparse-times-dense product covering all messages). Seen nodes outside
+        # the frontier have no unseen neighbours, so they would add nothing here.
+        hits = self.adj @ frontier.astype(np.int32)
+        hits[seen] = 0
+        # No unseen node next to any seen node: the flood has covered its component
+        saturated = hits.sum(axis=0) == 0
 
         # Detect collisions
-        self.blocked_nodes = {node_id for node_id, count in message_hits.items() if count > 1}
+        blocked = hits.sum(axis=1) > 1
+        self.blocked = blocked
+
+        # Spread messages
+        new_seen, edges, offsets = _expand_frontier(self.indptr, self.indices, frontier, seen, blocked)
+        # A frontier node is done once all its neighbours have the message, which is
+        # guaranteed unless it or one of its neighbours collided this step
+        near_blocked = blocked | (self.adj @ blocked.astype(np.int32) > 0)
+        frontier = new_seen | (frontier & near_blocked[:, None])
+        seen |= new_seen
+        self.seen[:, cols] = forward = np.where(grow_back, forward, seen)
+        self.seen_back[:, cols] = backward = np.where(grow_back, seen, backward)
+        self.frontier[:, cols] = np.where(grow_back, self.frontier[:, cols], frontier)
+        self.frontier_back[:, cols] = np.where(grow_back, frontier, self.frontier_back[:, cols])
+        # Delivered once the two sides meet (for flooding: the destination is reached)
+        delivered = (forward & backward).any(axis=0)
+        self.hop_count[cols] += 1
+        expired = ~delivered & (saturated | (self.hop_count[cols] >= self.ttls[cols]))
+
+        # Append every message's block of new edges in one scatter
+        counts = np.diff(offsets)
+        end = self.edge_count[cols] + counts
+        if len(end) and end.max() > self.message_edges.shape[1]:
+            self._grow_message_edges(end.max())
+        owners = np.repeat(cols, counts)
+        slots = np.repeat(self.edge_count[cols] - offsets[:-1], counts) + np.arange(len(edges))
+        self.message_edges[owners, slots] = edges
+        self.edge_count[cols] = end
+
+        # Only messages whose state flipped this step need Python-level updates
+        for i in np.flatnonzero(delivered).tolist():
+            self.message_manager.mark_delivered(active[i])
+        for i in np.flatnonzero(expired).tolist():
+            self.message_manager.mark_expired(active[i])
+
+
+    def _detect_collisions(self):
+        # Nodes reached by more than one path edge of the active messages
+        receivers = [self.get_message_edges(msg.message_id)[:, 1] for msg in self.message_manager.get_active_messages()]
+        if receivers:
+            message_hits = np.bincount(np.concatenate(receivers), minlength=len(self.graph))
+            self.blocked |= message_hits > 1
+
+    def run_batch(self, num_ticks):
+        # Step without drawing until every message is done or num_ticks ran out
+        messages = self.message_manager.messages
+        for _ in range(num_ticks):
+            if all(msg.delivered or msg.expired for msg in messages):
+                break
+            self.step()
+        # step() replaces blocked each tick, so the path collisions only matter
+        # for the final state
+        self._detect_collisions()
+        return {
+            "ticks": self.message_manager.current_time,
+            "delivered": sum(msg.delivered for msg in messages),
+            "expired": sum(msg.expired for msg in messages),
+            "pending": sum(not (msg.delivered or msg.expired) for msg in messages),
+        }
 
-        # Second pass to spread messages
-        for msg in self.message_manager.get_active_messages():
-            if time < msg.timestamp or msg.delivered or msg.expired:
-                continue
+    def run_gui(self):
+        if self.headless:
+            raise RuntimeError("Headless simulators have no figure; use run_batch() instead")
+        self.visualize()
 
-            seen_nodes = self.message_states[msg.message_id]
-            new_seen = set()
+        def on_enter():
+            # Acknowledge all completed messages
+            for msg in self.message_manager.messages:
+                if msg.delivered or msg.expired:
+                    self.acknowledged[msg.message_id] = True
 
-            for node in seen_nodes:
-                if node in self.blocked_nodes:
-                    continue  # skip spreading from collided node
-                for neighbor in graph.neighbors(node):
-                    if neighbor in self.blocked_nodes:
-                        continue  # don't forward to a collided node
-                    if neighbor not in seen_nodes:
-                        new_seen.add(neighbor)
-                        self.message_edges[msg.message_id].append((node, neighbor))
-                    if neighbor == msg.destination:
-                        self.message_manager.mark_delivered(msg)
+            if self.waiting_for_final_enter:
+                print("Simulation ended. Pressed ENTER after final message.")
+                return True
+            self.step()
+            self.visualize()
+            return False
 
-            seen_nodes.update(new_seen)
+        if self.backend == "vispy":
+            from vispy import app
 
+            def on_vispy_key(event):
+                if event.key == 'Enter' and on_enter():
+                    self.canvas.close()
+                    app.quit()
 
-    def run_gui(self):
-        self.visualize()
+            self.canvas.events.key_press.connect(on_vispy_key)
+            self.canvas.show()
+            app.run()
+            return
 
         def on_key(event):
-            if event.key == 'enter':
-                # Acknowledge all completed messages
-                for msg in self.message_manager.messages:
-                    if msg.delivered or msg.expired:
-                        self.acknowledged[msg.message_id] = True
-
-                if self.waiting_for_final_enter:
-                    print("Simulation ended. Pressed ENTER after final message.")
-                    plt.close('all')
-                else:
-                    self.step()
-                    self.visualize()
+            if event.key == 'enter' and on_enter():
+                plt.close('all')
 
         self.fig.canvas.mpl_connect('key_press_event', on_key)
         plt.show()
 
     def visualize(self):
-        graph = self.network.get_graph()
-        pos = self.network.get_positions()
-        self.ax.clear()
-        self.fig.subplots_adjust(right=0.75)
+        if self.headless:
+            return
+        graph = self.graph
         current_time = self.message_manager.current_time
 
-        # Track collisions
-        message_hits = {}  # node_id → number of messages received this round
-
-        for msg in self.message_manager.get_active_messages():
-            if current_time >= msg.timestamp and not msg.delivered and not msg.expired:
-                msg_id = msg.message_id
-                for u, v in self.message_edges[msg_id]:
-                    if v not in message_hits:
-                        message_hits[v] = 0
-                    message_hits[v] += 1
-        
-        for node_id, count in message_hits.items():
-            if count > 1:
-                self.blocked_nodes.add(node_id)
-
-
-        # Node coloring
-        colors = []
-        for node_id in graph.nodes:
-            color = "lightblue"
-
-            if node_id in self.blocked_nodes:
-                color = "pink"
-            for msg in self.message_manager.messages:
-                if not self.acknowledged[msg.message_id] and msg.timestamp <= current_time:
-                    if msg.source == node_id:
-                        color = "green"
-                    elif msg.destination == node_id:
-                        color = "red"
-
-            colors.append(color)
+        self._detect_collisions()
 
+        # Only set wait flag — don't close yet
+        if all((msg.delivered or msg.expired) for msg in self.message_manager.messages):
+            self.waiting_for_final_enter = True
 
-        # Draw base graph and colored nodes
-        nx.draw_networkx_edges(graph, pos, ax=self.ax, alpha=0.3)
-        nx.draw_networkx_nodes(graph, pos, node_color=colors, node_size=600, ax=self.ax)
-        nx.draw_networkx_labels(graph, pos, ax=self.ax)
-
-        # Draw message paths
-        cmap = ["blue", "purple", "orange", "brown", "darkgreen", "black", "cyan"]
-        for idx, (msg_id, edges) in enumerate(self.message_edges.items()):
-            if not self.acknowledged.get(msg_id, False):
-                if idx < len(cmap):
-                    nx.draw_networkx_edges(graph, pos, edgelist=edges, width=2, edge_color=cmap[idx], ax=self.ax)
+        # Node coloring: endpoints of started, unacknowledged messages stand out,
+        # destinations over sources over collided nodes
+        shown = ~self.acknowledged & (self.timestamps <= current_time)
+        is_source = np.zeros(len(graph), dtype=bool)
+        is_source[self.sources[shown]] = True
+        is_destination = np.zeros(len(graph), dtype=bool)
+        is_destination[self.destinations[shown]] = True
+        codes = np.where(is_destination, self.DESTINATION,
+                         np.where(is_source, self.SOURCE,
+                                  np.where(self.blocked, self.COLLIDED, self.IDLE)))
+        colors = self.NODE_COLORS[codes]
+
+        if self.backend == "vispy":
+            self._draw_graph_vispy(colors)
+        else:
+            # Recolor the nodes
+            self.node_artist.set_facecolor(colors)
+
+            # Update message paths
+            for msg_id, artist in self.message_artists.items():
+                # Paths only grow, so a path needs new segments only when its
+                # edge count changed or it was acknowledged (and hidden)
+                shown = 0 if self.acknowledged[msg_id] else self.edge_count[msg_id]
+                if shown == self.drawn_edge_count[msg_id]:
+                    continue
+                # (k, 2) node pairs -> (k, 2, 2) segment endpoints in one lookup
+                artist.set_segments(self.pos_arr[self.get_message_edges(msg_id)[:shown]])
+                self.drawn_edge_count[msg_id] = shown
 
         # Separate messages by status
         active_messages = []
@@ -161,7 +421,7 @@ class Simulator:
                 status = "Waiting"
             else:
                 status = "Active"
-            line = f"#{m.message_id}: {m.source}→{m.destination} | TTL={m.ttl} | T={m.timestamp} | {status}"
+            line = self._desc_prefix[m.message_id] + status
             active_descriptions.append(line)
 
         # Completed messages (green for delivered, red for expired)
@@ -170,12 +430,15 @@ class Simulator:
                 status = "✓ Delivered"
             else:
                 status = "✗ Expired"
-            line = f"#{m.message_id}: {m.source}→{m.destination} | TTL={m.ttl} | T={m.timestamp} | {status}"
+            line = self._desc_prefix[m.message_id] + status
             completed_descriptions.append(line)
 
-        # Clear old texts
-        for txt in self.fig.texts:
-            txt.set_visible(False)
+        # Hide all panels; the ones with messages are shown again below
+        for txt in self.panel_texts.values():
+            if self.backend == "vispy":
+                txt.visible = False
+            else:
+                txt.set_visible(False)
 
         # Display active messages
         if active_descriptions:
@@ -187,14 +450,12 @@ class Simulator:
            
             # Show waiting messages in black
             if waiting_msgs:
-                self.fig.text(0.78, y_pos, "Waiting Messages:\n" + "\n".join(waiting_msgs),
-                            fontsize=9, va='top', ha='left', transform=self.fig.transFigure, color='black')
+                self._show_panel("waiting", y_pos, "Waiting Messages:\n" + "\n".join(waiting_msgs))
                 y_pos -= 0.15
            
             # Show active messages in blue
             if active_msgs:
-                self.fig.text(0.78, y_pos, "Active Messages:\n" + "\n".join(active_msgs),
-                            fontsize=9, va='top', ha='left', transform=self.fig.transFigure, color='blue')
+                self._show_panel("active", y_pos, "Active Messages:\n" + "\n".join(active_msgs))
 
         # Display completed messages
         if completed_descriptions:
@@ -204,16 +465,54 @@ class Simulator:
            
             y_pos = 0.4
             if delivered_msgs:
-                self.fig.text(0.78, y_pos, "Completed Successfully:\n" + "\n".join(delivered_msgs),
-                            fontsize=9, va='top', ha='left', transform=self.fig.transFigure, color='green')
+                self._show_panel("delivered", y_pos, "Completed Successfully:\n" + "\n".join(delivered_msgs))
                 y_pos -= 0.15
            
             if expired_msgs:
-                self.fig.text(0.78, y_pos, "Failed/Expired:\n" + "\n".join(expired_msgs),
-                            fontsize=9, va='top', ha='left', transform=self.fig.transFigure, color='red')
+                self._show_panel("expired", y_pos, "Failed/Expired:\n" + "\n".join(expired_msgs))
+        if self.backend == "vispy":
+            # The window title carries the clock
+            self.canvas.title = f"Time: {current_time}"
+            self.canvas.update()
+            return
+
         self.ax.set_title(f"Time: {current_time}")
-        plt.pause(0.01)
 
-        # Only set wait flag — don't close yet
-        if all((msg.delivered or msg.expired) for msg in self.message_manager.messages):
-            self.waiting_for_final_enter = True
+        # Blit the dynamic artists over the cached background; until the first
+        # full draw has produced one, just request that draw
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(self._background)
+            for artist in self._dynamic_artists():
+                self.fig.draw_artist(artist)
+            canvas.blit(self.fig.bbox)
+
+    def _show_panel(self, status, y_pos, text):
+        panel = self.panel_texts[status]
+        if self.backend == "vispy":
+            # Figure fractions (y up) -> canvas pixels (y down), one string per line
+            width, height = self.canvas.size
+            lines = text.split("\n")
+            panel.text = lines
+            panel.pos = np.column_stack([np.full(len(lines), 0.78 * width),
+                                         (1 - y_pos) * height + 15 * np.arange(len(lines))])
+            panel.visible = True
+            return
+        panel.set_position((0.78, y_pos))
+        panel.set_text(text)
+        panel.set_visible(True)
+
+    def _draw_graph_vispy(self, colors):
+        # Node colors and path segments go straight into the visuals' GPU buffers
+        self.node_artist.set_data(self.pos_arr, size=24, face_color=colors)
+        for msg_id, line in self.message_artists.items():
+            shown = 0 if self.acknowledged[msg_id] else self.edge_count[msg_id]
+            if shown == self.drawn_edge_count[msg_id]:
+                continue
+            # A segment line takes its endpoints as consecutive rows
+            if shown:
+                line.set_data(pos=self.pos_arr[self.get_message_edges(msg_id)[:shown]].reshape(-1, 2))
+            line.visible = shown > 0
+            self.drawn_edge_count[msg_id] = shown